@@ -25,6 +25,7 @@
 import type { AspectPattern } from '../aspects/types.js';
 import { CelestialBody } from '../ephemeris/positions.js';
 import type { HouseSystem } from '../houses/types.js';
+import { getSignName } from '../zodiac/sign-properties.js';
 import type { Sign } from '../zodiac/types.js';
 import { calculateChartAspects, detectChartPatterns } from './aspect-calculation.js';
 import { generateChartSummary } from './chart-summary.js';
@@ -357,29 +358,19 @@ export function calculatePlanets(birth: BirthData, options?: Partial<ChartOption
   const placeholderHouses: ChartHouses = {
     system: 'equal',
     systemName: 'Equal',
-    cusps: Array.from({ length: 12 }, (_, i) => ({
-      house: i + 1,
-      longitude: i * 30,
-      sign: i as Sign,
-      signName: [
-        'Aries',
-        'Taurus',
-        'Gemini',
-        'Cancer',
-        'Leo',
-        'Virgo',
-        'Libra',
-        'Scorpio',
-        'Sagittarius',
-        'Capricorn',
-        'Aquarius',
-        'Pisces',
-      ][i],
-      degree: 0,
-      minute: 0,
-      formatted: `0° ${['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo', 'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'][i]}`,
-      size: 30,
-    })),
+    cusps: Array.from({ length: 12 }, (_, i) => {
+      const signName = getSignName(i as Sign);
+      return {
+        house: i + 1,
+        longitude: i * 30,
+        sign: i as Sign,
+        signName,
+        degree: 0,
+        minute: 0,
+        formatted: `0° ${signName}`,
+        size: 30,
+      };
+    }),
   };
 
   // Convert to chart planets
@@ -497,18 +488,20 @@ export function formatChart(chart: Chart): string {
   lines.push('═══════════════════════════════════════════════════════════════');
   lines.push('');
 
-  // Birth data
+  // Birth data: resolve each field first, then fill the fixed templates
   const { input } = chart;
+  const pad2 = (value: number) => String(value).padStart(2, '0');
+  const date = `${input.year}-${pad2(input.month)}-${pad2(input.day)}`;
+  const time = `${pad2(input.hour)}:${pad2(input.minute)}:${pad2(input.second ?? 0)}`;
+  const utcOffset = `${input.timezone >= 0 ? '+' : ''}${input.timezone}`;
+  const latitude = `${Math.abs(input.latitude).toFixed(4)}°${input.latitude >= 0 ? 'N' : 'S'}`;
+  const longitude = `${Math.abs(input.longitude).toFixed(4)}°${input.longitude >= 0 ? 'E' : 'W'}`;
   lines.push(
-    `Date: ${input.year}-${String(input.month).padStart(2, '0')}-${String(input.day).padStart(2, '0')}`,
+    `Date: ${date}`,
+    `Time: ${time} (UTC${utcOffset})`,
+    `Location: ${latitude}, ${longitude}`,
+    '',
   );
-  lines.push(
-    `Time: ${String(input.hour).padStart(2, '0')}:${String(input.minute).padStart(2, '0')}:${String(input.second ?? 0).padStart(2, '0')} (UTC${input.timezone >= 0 ? '+' : ''}${input.timezone})`,
-  );
-  lines.push(
-    `Location: ${Math.abs(input.latitude).toFixed(4)}°${input.latitude >= 0 ? 'N' : 'S'}, ${Math.abs(input.longitude).toFixed(4)}°${input.longitude >= 0 ? 'E' : 'W'}`,
-  );
-  lines.push('');
 
   // Angles
   lines.push('─────────────────────── ANGLES ───────────────────────');
@@ -545,14 +538,17 @@ export function formatChart(chart: Chart): string {
   lines.push('');
 
   // Aspects summary
-  lines.push('────────────────────── ASPECTS ──────────────────────');
-  lines.push(`  Total: ${chart.aspects.count}`);
-  lines.push(`  Conjunctions: ${chart.aspects.summary.conjunctions}`);
-  lines.push(`  Sextiles: ${chart.aspects.summary.sextiles}`);
-  lines.push(`  Squares: ${chart.aspects.summary.squares}`);
-  lines.push(`  Trines: ${chart.aspects.summary.trines}`);
-  lines.push(`  Oppositions: ${chart.aspects.summary.oppositions}`);
-  lines.push('');
+  const { count, summary } = chart.aspects;
+  lines.push(
+    '────────────────────── ASPECTS ──────────────────────',
+    `  Total: ${count}`,
+    `  Conjunctions: ${summary.conjunctions}`,
+    `  Sextiles: ${summary.sextiles}`,
+    `  Squares: ${summary.squares}`,
+    `  Trines: ${summary.trines}`,
+    `  Oppositions: ${summary.oppositions}`,
+    '',
+  );
 
   // Patterns
   if (chart.patterns.length > 0) {
@@ -8,7 +8,6 @@
 
 import { calculateHouses as calculateHousesCore } from '../houses/houses.js';
 import type { GeographicLocation, HouseData, HouseSystem } from '../houses/types.js';
-import { getSignName } from '../zodiac/sign-properties.js';
 import { eclipticToZodiac } from '../zodiac/zodiac.js';
 import {
   FALLBACK_HOUSE_SYSTEM,
@@ -143,7 +142,7 @@ function buildAngle(
     abbrev,
     longitude,
     sign: zodiacPos.sign,
-    signName: getSignName(zodiacPos.sign),
+    signName: zodiacPos.signName,
     degree: zodiacPos.degree,
     minute: zodiacPos.minute,
     second: zodiacPos.second,
@@ -173,7 +172,7 @@ function buildChartHouses(houseData: HouseData, system: HouseSystem): ChartHouse
       house: i + 1,
       longitude,
       sign: zodiacPos.sign,
-      signName: getSignName(zodiacPos.sign),
+      signName: zodiacPos.signName,
       degree: zodiacPos.degree,
       minute: zodiacPos.minute,
       formatted: zodiacPos.formatted,
@@ -34,6 +34,49 @@ import type { PlanetPosition } from '../ephemeris/types.js';
 import { BODY_NAMES, PLANET_ORDER, STATIONARY_THRESHOLD } from './constants.js';
 import type { ChartOptions } from './types.js';
 
+/**
+ * Display names for every celestial body.
+ */
+const BODY_DISPLAY_NAMES: Record<CelestialBody, string> = {
+  [CelestialBody.Sun]: BODY_NAMES.sun,
+  [CelestialBody.Moon]: BODY_NAMES.moon,
+  [CelestialBody.Mercury]: BODY_NAMES.mercury,
+  [CelestialBody.Venus]: BODY_NAMES.venus,
+  [CelestialBody.Mars]: BODY_NAMES.mars,
+  [CelestialBody.Jupiter]: BODY_NAMES.jupiter,
+  [CelestialBody.Saturn]: BODY_NAMES.saturn,
+  [CelestialBody.Uranus]: BODY_NAMES.uranus,
+  [CelestialBody.Neptune]: BODY_NAMES.neptune,
+  [CelestialBody.Pluto]: BODY_NAMES.pluto,
+  [CelestialBody.Chiron]: BODY_NAMES.chiron,
+  [CelestialBody.Ceres]: BODY_NAMES.ceres,
+  [CelestialBody.Pallas]: BODY_NAMES.pallas,
+  [CelestialBody.Juno]: BODY_NAMES.juno,
+  [CelestialBody.Vesta]: BODY_NAMES.vesta,
+  [CelestialBody.NorthNode]: BODY_NAMES.northNode,
+  [CelestialBody.TrueNorthNode]: BODY_NAMES.northNode,
+  [CelestialBody.SouthNode]: BODY_NAMES.southNode,
+  [CelestialBody.TrueSouthNode]: BODY_NAMES.southNode,
+  [CelestialBody.Lilith]: BODY_NAMES.meanLilith,
+  [CelestialBody.TrueLilith]: BODY_NAMES.trueLilith,
+};
+
+/**
+ * Traditional display order of the main planets.
+ */
+const SORTED_BODY_ORDER: readonly CelestialBody[] = [
+  CelestialBody.Sun,
+  CelestialBody.Moon,
+  CelestialBody.Mercury,
+  CelestialBody.Venus,
+  CelestialBody.Mars,
+  CelestialBody.Jupiter,
+  CelestialBody.Saturn,
+  CelestialBody.Uranus,
+  CelestialBody.Neptune,
+  CelestialBody.Pluto,
+];
+
 /**
  * Result of planetary position calculations.
  */
@@ -206,31 +249,7 @@ export function isStationary(position: PlanetPosition): boolean {
  * @returns Human-readable name
  */
 export function getBodyName(body: CelestialBody): string {
-  const nameMap: Record<CelestialBody, string> = {
-    [CelestialBody.Sun]: BODY_NAMES.sun,
-    [CelestialBody.Moon]: BODY_NAMES.moon,
-    [CelestialBody.Mercury]: BODY_NAMES.mercury,
-    [CelestialBody.Venus]: BODY_NAMES.venus,
-    [CelestialBody.Mars]: BODY_NAMES.mars,
-    [CelestialBody.Jupiter]: BODY_NAMES.jupiter,
-    [CelestialBody.Saturn]: BODY_NAMES.saturn,
-    [CelestialBody.Uranus]: BODY_NAMES.uranus,
-    [CelestialBody.Neptune]: BODY_NAMES.neptune,
-    [CelestialBody.Pluto]: BODY_NAMES.pluto,
-    [CelestialBody.Chiron]: BODY_NAMES.chiron,
-    [CelestialBody.Ceres]: BODY_NAMES.ceres,
-    [CelestialBody.Pallas]: BODY_NAMES.pallas,
-    [CelestialBody.Juno]: BODY_NAMES.juno,
-    [CelestialBody.Vesta]: BODY_NAMES.vesta,
-    [CelestialBody.NorthNode]: BODY_NAMES.northNode,
-    [CelestialBody.TrueNorthNode]: BODY_NAMES.northNode,
-    [CelestialBody.SouthNode]: BODY_NAMES.southNode,
-    [CelestialBody.TrueSouthNode]: BODY_NAMES.southNode,
-    [CelestialBody.Lilith]: BODY_NAMES.meanLilith,
-    [CelestialBody.TrueLilith]: BODY_NAMES.trueLilith,
-  };
-
-  return nameMap[body] ?? String(body);
+  return BODY_DISPLAY_NAMES[body] ?? String(body);
 }
 
 /**
@@ -251,22 +270,9 @@ export function getPlanetOrder(): readonly string[] {
 export function sortedPlanetList(
   positions: Map<CelestialBody, PlanetPosition>,
 ): Array<[CelestialBody, PlanetPosition]> {
-  const bodyOrder: CelestialBody[] = [
-    CelestialBody.Sun,
-    CelestialBody.Moon,
-    CelestialBody.Mercury,
-    CelestialBody.Venus,
-    CelestialBody.Mars,
-    CelestialBody.Jupiter,
-    CelestialBody.Saturn,
-    CelestialBody.Uranus,
-    CelestialBody.Neptune,
-    CelestialBody.Pluto,
-  ];
-
   const result: Array<[CelestialBody, PlanetPosition]> = [];
 
-  for (const body of bodyOrder) {
+  for (const body of SORTED_BODY_ORDER) {
     const pos = positions.get(body);
     if (pos) {
       result.push([body, pos]);
@@ -9,10 +9,10 @@
 import { CelestialBody } from '../ephemeris/positions.js';
 import type { PlanetPosition } from '../ephemeris/types.js';
 import { getPlanetaryDignity } from '../zodiac/dignities.js';
-import { getSignName } from '../zodiac/sign-properties.js';
-import { DignityState, Planet, Sign } from '../zodiac/types.js';
+import type { ZodiacPosition } from '../zodiac/types.js';
+import { DignityState, Planet, type Sign } from '../zodiac/types.js';
 import { eclipticToZodiac } from '../zodiac/zodiac.js';
-import { getHouseNumber } from './house-calculation.js';
+import { getCuspLongitudes, getHouseNumber } from './house-calculation.js';
 import { getBodyName, isRetrograde } from './planet-positions.js';
 import type { ChartHouses, ChartLilith, ChartLot, ChartNode, ChartPlanet } from './types.js';
 
@@ -32,6 +32,61 @@ const BODY_TO_PLANET: Partial<Record<CelestialBody, Planet>> = {
   [CelestialBody.Pluto]: Planet.Pluto,
 };
 
+/**
+ * Element of each sign, indexed by Sign (fire, earth, air, water repeating).
+ */
+const SIGN_ELEMENTS = [
+  'fire',
+  'earth',
+  'air',
+  'water',
+  'fire',
+  'earth',
+  'air',
+  'water',
+  'fire',
+  'earth',
+  'air',
+  'water',
+] as const;
+
+/**
+ * Modality of each sign, indexed by Sign (cardinal, fixed, mutable repeating).
+ */
+const SIGN_MODALITIES = [
+  'cardinal',
+  'fixed',
+  'mutable',
+  'cardinal',
+  'fixed',
+  'mutable',
+  'cardinal',
+  'fixed',
+  'mutable',
+  'cardinal',
+  'fixed',
+  'mutable',
+] as const;
+
+/**
+ * Houses on the eastern (rising) side of the chart.
+ */
+const EASTERN_HOUSES: ReadonlySet<number> = new Set([10, 11, 12, 1, 2, 3]);
+
+/**
+ * Place a longitude in its sign and house.
+ *
+ * Shared by all chart body builders.
+ */
+function placeLongitude(
+  longitude: number,
+  houses: ChartHouses,
+): { zodiacPos: ZodiacPosition; house: number } {
+  const zodiacPos = eclipticToZodiac(longitude);
+  const house = getHouseNumber(longitude, getCuspLongitudes(houses));
+  return { zodiacPos, house };
+}
+
 /**
  * Build a ChartPlanet from a celestial position.
  *
@@ -45,9 +100,7 @@ export function buildChartPlanet(
   position: PlanetPosition,
   houses: ChartHouses,
 ): ChartPlanet {
-  const zodiacPos = eclipticToZodiac(position.longitude);
-  const cusps = houses.cusps.map((c) => c.longitude);
-  const house = getHouseNumber(position.longitude, cusps);
+  const { zodiacPos, house } = placeLongitude(position.longitude, houses);
 
   // Get dignity (if this body has dignity mappings)
   const planet = BODY_TO_PLANET[body];
@@ -78,7 +131,7 @@ export function buildChartPlanet(
     longitudeSpeed: position.longitudeSpeed,
     isRetrograde: isRetrograde(position),
     sign: zodiacPos.sign,
-    signName: getSignName(zodiacPos.sign),
+    signName: zodiacPos.signName,
     degree: zodiacPos.degree,
     minute: zodiacPos.minute,
     second: zodiacPos.second,
@@ -103,16 +156,14 @@ export function buildChartNode(
   longitude: number,
   houses: ChartHouses,
 ): ChartNode {
-  const zodiacPos = eclipticToZodiac(longitude);
-  const cusps = houses.cusps.map((c) => c.longitude);
-  const house = getHouseNumber(longitude, cusps);
+  const { zodiacPos, house } = placeLongitude(longitude, houses);
 
   return {
     name,
     type,
     longitude,
     sign: zodiacPos.sign,
-    signName: getSignName(zodiacPos.sign),
+    signName: zodiacPos.signName,
     degree: zodiacPos.degree,
     minute: zodiacPos.minute,
     formatted: zodiacPos.formatted,
@@ -133,16 +184,14 @@ export function buildChartLilith(
   longitude: number,
   houses: ChartHouses,
 ): ChartLilith {
-  const zodiacPos = eclipticToZodiac(longitude);
-  const cusps = houses.cusps.map((c) => c.longitude);
-  const house = getHouseNumber(longitude, cusps);
+  const { zodiacPos, house } = placeLongitude(longitude, houses);
 
   return {
     name: type === 'Mean' ? 'Mean Lilith' : 'True Lilith',
     type,
     longitude,
     sign: zodiacPos.sign,
-    signName: getSignName(zodiacPos.sign),
+    signName: zodiacPos.signName,
     degree: zodiacPos.degree,
     minute: zodiacPos.minute,
     formatted: zodiacPos.formatted,
@@ -165,16 +214,14 @@ export function buildChartLot(
   longitude: number,
   houses: ChartHouses,
 ): ChartLot {
-  const zodiacPos = eclipticToZodiac(longitude);
-  const cusps = houses.cusps.map((c) => c.longitude);
-  const house = getHouseNumber(longitude, cusps);
+  const { zodiacPos, house } = placeLongitude(longitude, houses);
 
   return {
     name,
     formula,
     longitude,
     sign: zodiacPos.sign,
-    signName: getSignName(zodiacPos.sign),
+    signName: zodiacPos.signName,
     degree: zodiacPos.degree,
     minute: zodiacPos.minute,
     formatted: zodiacPos.formatted,
@@ -197,34 +244,22 @@ export function getSignForLongitude(longitude: number): Sign {
  * Get element for a sign.
  */
 export function getElement(sign: Sign): 'fire' | 'earth' | 'air' | 'water' {
-  const fireSign = [Sign.Aries, Sign.Leo, Sign.Sagittarius];
-  const earthSigns = [Sign.Taurus, Sign.Virgo, Sign.Capricorn];
-  const airSigns = [Sign.Gemini, Sign.Libra, Sign.Aquarius];
-
-  if (fireSign.includes(sign)) return 'fire';
-  if (earthSigns.includes(sign)) return 'earth';
-  if (airSigns.includes(sign)) return 'air';
-  return 'water';
+  return SIGN_ELEMENTS[sign] ?? 'water';
 }
 
 /**
  * Get modality for a sign.
  */
 export function getModality(sign: Sign): 'cardinal' | 'fixed' | 'mutable' {
-  const cardinal = [Sign.Aries, Sign.Cancer, Sign.Libra, Sign.Capricorn];
-  const fixed = [Sign.Taurus, Sign.Leo, Sign.Scorpio, Sign.Aquarius];
-
-  if (cardinal.includes(sign)) return 'cardinal';
-  if (fixed.includes(sign)) return 'fixed';
-  return 'mutable';
+  return SIGN_MODALITIES[sign] ?? 'mutable';
 }
 
 /**
  * Get polarity for a sign.
  */
 export function getPolarity(sign: Sign): 'positive' | 'negative' {
-  const positive = [Sign.Aries, Sign.Gemini, Sign.Leo, Sign.Libra, Sign.Sagittarius, Sign.Aquarius];
-  return positive.includes(sign) ? 'positive' : 'negative';
+  // Fire and air signs (even indices) are positive, earth and water negative
+  return sign % 2 === 0 ? 'positive' : 'negative';
 }
 
 /**
@@ -256,8 +291,7 @@ export function getHemisphere(house: number): {
 
   // East = houses 10, 11, 12, 1, 2, 3 (rising side)
   // West = houses 4, 5, 6, 7, 8, 9 (setting side)
-  const eastern = [10, 11, 12, 1, 2, 3];
-  const horizontal = eastern.includes(house) ? 'east' : 'west';
+  const horizontal = EASTERN_HOUSES.has(house) ? 'east' : 'west';
 
   return { vertical, horizontal };
 }
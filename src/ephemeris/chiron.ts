@@ -302,15 +302,13 @@ export function getChironPosition(jd: number, options: EphemerisOptions = {}): P
   const geoDist = Math.sqrt(geoX * geoX + geoY * geoY + geoZ * geoZ);
 
   // Normalize longitude
-  while (geoLon < 0) geoLon += 360;
-  while (geoLon >= 360) geoLon -= 360;
+  geoLon = ((geoLon % 360) + 360) % 360;
 
   // Apply aberration correction
   const aberration = -0.005694;
   geoLon += aberration;
 
-  while (geoLon < 0) geoLon += 360;
-  while (geoLon >= 360) geoLon -= 360;
+  geoLon = ((geoLon % 360) + 360) % 360;
 
   // Calculate speed if requested
   let longitudeSpeed = 0;
@@ -174,16 +174,14 @@ export function getPlutoPosition(jd: number, options: EphemerisOptions = {}): Pl
   const geoDist = Math.sqrt(geoX * geoX + geoY * geoY + geoZ * geoZ);
 
   // Normalize longitude to [0, 360)
-  while (geoLon < 0) geoLon += 360;
-  while (geoLon >= 360) geoLon -= 360;
+  geoLon = ((geoLon % 360) + 360) % 360;
 
   // Apply aberration correction
   const aberration = -0.005694;
   geoLon += aberration;
 
   // Normalize again
-  while (geoLon < 0) geoLon += 360;
-  while (geoLon >= 360) geoLon -= 360;
+  geoLon = ((geoLon % 360) + 360) % 360;
 
   // Calculate speed if requested
   let longitudeSpeed = 0;
@@ -218,10 +216,8 @@ export function getPlutoPosition(jd: number, options: EphemerisOptions = {}): Pl
  */
 export function plutoHeliocentricLongitude(jd: number): number {
   const { L } = plutoHeliocentric(jd);
-  let lon = L * RAD_TO_DEG;
-  while (lon < 0) lon += 360;
-  while (lon >= 360) lon -= 360;
-  return lon;
+  const lon = L * RAD_TO_DEG;
+  return ((lon % 360) + 360) % 360;
 }
 
 /**
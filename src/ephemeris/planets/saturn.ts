@@ -732,8 +732,7 @@ export function getSaturnPosition(jd: number, options: EphemerisOptions = {}): P
   const geoDist = Math.sqrt(geoX * geoX + geoY * geoY + geoZ * geoZ);
 
   // Normalize longitude to [0, 360)
-  while (geoLon < 0) geoLon += 360;
-  while (geoLon >= 360) geoLon -= 360;
+  geoLon = ((geoLon % 360) + 360) % 360;
 
   // Apply aberration correction (approximate)
   // Aberration constant: 20.4955" = 0.005694°
@@ -741,8 +740,7 @@ export function getSaturnPosition(jd: number, options: EphemerisOptions = {}): P
   geoLon += aberration;
 
   // Normalize again
-  while (geoLon < 0) geoLon += 360;
-  while (geoLon >= 360) geoLon -= 360;
+  geoLon = ((geoLon % 360) + 360) % 360;
 
   // Calculate speed if requested
   let longitudeSpeed = 0;
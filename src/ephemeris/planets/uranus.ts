@@ -589,16 +589,14 @@ export function getUranusPosition(jd: number, options: EphemerisOptions = {}): P
   const geoDist = Math.sqrt(geoX * geoX + geoY * geoY + geoZ * geoZ);
 
   // Normalize longitude to [0, 360)
-  while (geoLon < 0) geoLon += 360;
-  while (geoLon >= 360) geoLon -= 360;
+  geoLon = ((geoLon % 360) + 360) % 360;
 
   // Apply aberration correction (approximate)
   const aberration = -0.005694;
   geoLon += aberration;
 
   // Normalize again
-  while (geoLon < 0) geoLon += 360;
-  while (geoLon >= 360) geoLon -= 360;
+  geoLon = ((geoLon % 360) + 360) % 360;
 
   // Calculate speed if requested
   let longitudeSpeed = 0;
@@ -35,6 +35,7 @@ import { asc1, asind, atand, cosd, mcToArmc, sind } from './shared.js';
  * @param midheaven - Midheaven in degrees (0-360)
  * @param latitude - Geographic latitude in degrees
  * @param obliquity - Obliquity of ecliptic in degrees
+ * @param armc - ARMC (local sidereal time) in degrees, if already known; derived from MC otherwise
  * @returns House cusps (1-12)
  *
  * @example
@@ -50,14 +51,15 @@ export function campanusHouses(
   midheaven: number,
   latitude: number,
   obliquity: number,
+  armc?: number,
 ): HouseCusps {
   const asc = normalizeAngle(ascendant);
   const mc = normalizeAngle(midheaven);
   const fi = latitude;
   const ekl = obliquity;
 
-  // Calculate ARMC (sidereal time) from MC
-  const th = mcToArmc(mc, ekl);
+  // Use the caller's ARMC, or recover it from MC
+  const th = armc !== undefined ? normalizeAngle(armc) : mcToArmc(mc, ekl);
 
   const sine = sind(ekl);
   const cose = cosd(ekl);
@@ -48,6 +48,7 @@ function signedDifference(a: number, b: number): number {
  * @param midheaven - Midheaven in degrees (0-360)
  * @param latitude - Geographic latitude in degrees
  * @param obliquity - Obliquity of ecliptic in degrees
+ * @param armc - ARMC (local sidereal time) in degrees, if already known; derived from MC otherwise
  * @returns House cusps (1-12)
  *
  * @throws {Error} If calculation fails (automatically falls back to Porphyry)
@@ -57,14 +58,15 @@ export function placidusHouses(
   midheaven: number,
   latitude: number,
   obliquity: number,
+  armc?: number,
 ): HouseCusps {
   const asc = normalizeAngle(ascendant);
   const mc = normalizeAngle(midheaven);
   const fi = latitude;
   const ekl = obliquity;
 
-  // Calculate ARMC (sidereal time) from MC
-  const th = mcToArmc(mc, ekl);
+  // Use the caller's ARMC, or recover it from MC
+  const th = armc !== undefined ? normalizeAngle(armc) : mcToArmc(mc, ekl);
 
   // Check if within polar circle - fall back to Porphyry
   if (Math.abs(fi) >= 90 - ekl) {
@@ -278,6 +278,12 @@ describe('House Utils', () => {
       assert.equal(getSignName(12), 'Aries');
       assert.equal(getSignName(13), 'Taurus');
     });
+
+    it('should wrap negative and fractional indices', () => {
+      assert.equal(getSignName(-1), 'Pisces');
+      assert.equal(getSignName(-12), 'Aries');
+      assert.equal(getSignName(1.5), 'Taurus');
+    });
   });
 
   describe('formatZodiacPosition', () => {
@@ -5,6 +5,9 @@
  * and angular relationships.
  */
 
+import { SIGN_DATA } from '../zodiac/constants.js';
+import type { Sign } from '../zodiac/types.js';
+
 /**
  * Normalize an angle to the range [0, 360)
  *
@@ -200,7 +203,8 @@ export function eclipticToZodiac(longitude: number): {
 } {
   const normalized = normalizeAngle(longitude);
   const signIndex = Math.floor(normalized / 30);
-  const degreeInSign = normalized % 30;
+  // Exact remainder from the quotient, without a second modulo
+  const degreeInSign = normalized - signIndex * 30;
 
   return {
     signIndex,
@@ -211,7 +215,7 @@ export function eclipticToZodiac(longitude: number): {
 /**
  * Get zodiac sign name from index
  *
- * @param signIndex - Sign index (0-11)
+ * @param signIndex - Sign index (0-11); other values wrap around the zodiac
  * @returns Sign name
  *
  * @example
@@ -219,25 +223,12 @@ export function eclipticToZodiac(longitude: number): {
  * getSignName(0)   // 'Aries'
  * getSignName(6)   // 'Libra'
  * getSignName(11)  // 'Pisces'
+ * getSignName(-1)  // 'Pisces'
  * ```
  */
 export function getSignName(signIndex: number): string {
-  const signs = [
-    'Aries',
-    'Taurus',
-    'Gemini',
-    'Cancer',
-    'Leo',
-    'Virgo',
-    'Libra',
-    'Scorpio',
-    'Sagittarius',
-    'Capricorn',
-    'Aquarius',
-    'Pisces',
-  ];
-
-  return signs[signIndex % 12];
+  const sign = ((Math.floor(signIndex) % 12) + 12) % 12;
+  return SIGN_DATA[sign as Sign].name;
 }
 
 /**
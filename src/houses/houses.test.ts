@@ -157,6 +157,15 @@ describe('Houses Module - Integration Tests', () => {
       assert.equal(results.placidus.angles.midheaven, results.equal.angles.midheaven);
     });
 
+    it('should give each system its own angles object', () => {
+      const results = calculateMultipleSystems(london, lst, T, ['placidus', 'koch']);
+      const kochAsc = results.koch.angles.ascendant;
+
+      results.placidus.angles.ascendant = 0;
+
+      assert.equal(results.koch.angles.ascendant, kochAsc);
+    });
+
     it('should calculate all systems by default', () => {
       const results = calculateMultipleSystems(london, lst, T);
 
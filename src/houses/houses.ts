@@ -19,6 +19,73 @@ import { meanObliquity } from './obliquity.js';
 import type { Angles, GeographicLocation, HouseCusps, HouseData, HouseSystem } from './types.js';
 import { validateLocation } from './validation.js';
 
+/**
+ * Calculate the cusps of one house system from precomputed angles
+ *
+ * The quadrant systems are handed the LST directly as their ARMC rather
+ * than recovering it from the MC.
+ *
+ * @internal
+ */
+function calculateCusps(
+  system: HouseSystem,
+  angles: Angles,
+  lst: number,
+  latitude: number,
+  obliquity: number,
+): HouseCusps {
+  switch (system) {
+    case 'equal':
+      return equalHouses(angles.ascendant);
+
+    case 'whole-sign':
+      return wholeSignHouses(angles.ascendant);
+
+    case 'porphyry':
+      return porphyryHouses(angles.ascendant, angles.midheaven);
+
+    case 'placidus':
+      return placidusHouses(angles.ascendant, angles.midheaven, latitude, obliquity, lst);
+
+    case 'koch':
+      return kochHouses(angles.ascendant, angles.midheaven, latitude, obliquity, lst);
+
+    case 'regiomontanus':
+      return regiomontanusHouses(angles.ascendant, angles.midheaven, latitude, obliquity, lst);
+
+    case 'campanus':
+      return campanusHouses(angles.ascendant, angles.midheaven, latitude, obliquity, lst);
+
+    default:
+      // TypeScript should prevent this, but be defensive
+      throw new Error(`Unknown house system: ${system}`);
+  }
+}
+
+/**
+ * Validate the location and compute the system-independent obliquity and angles
+ *
+ * @throws {Error} If location is invalid
+ *
+ * @internal
+ */
+function prepareHouseFrame(
+  location: GeographicLocation,
+  lst: number,
+  julianCenturies: number,
+): { obliquity: number; angles: Angles } {
+  // Validate location
+  const validation = validateLocation(location);
+  if (!validation.valid) {
+    throw new Error(`Invalid location: ${validation.errors.join(', ')}`);
+  }
+
+  const obliquity = meanObliquity(julianCenturies);
+  const angles = calculateAngles(lst, obliquity, location.latitude);
+
+  return { obliquity, angles };
+}
+
 /**
  * Calculate house cusps for a given location, time, and house system
  *
@@ -53,56 +120,10 @@ export function calculateHouses(
   julianCenturies: number,
   system: HouseSystem = 'placidus',
 ): HouseData {
-  // Validate location
-  const validation = validateLocation(location);
-  if (!validation.valid) {
-    throw new Error(`Invalid location: ${validation.errors.join(', ')}`);
-  }
-
-  const { latitude } = location;
-
-  // Calculate obliquity for the given time
-  const obliquity = meanObliquity(julianCenturies);
-
-  // Calculate the four angles
-  const angles = calculateAngles(lst, obliquity, latitude);
+  const { obliquity, angles } = prepareHouseFrame(location, lst, julianCenturies);
 
   // Calculate house cusps based on system
-  let cusps: HouseCusps;
-
-  switch (system) {
-    case 'equal':
-      cusps = equalHouses(angles.ascendant);
-      break;
-
-    case 'whole-sign':
-      cusps = wholeSignHouses(angles.ascendant);
-      break;
-
-    case 'porphyry':
-      cusps = porphyryHouses(angles.ascendant, angles.midheaven);
-      break;
-
-    case 'placidus':
-      cusps = placidusHouses(angles.ascendant, angles.midheaven, latitude, obliquity);
-      break;
-
-    case 'koch':
-      cusps = kochHouses(angles.ascendant, angles.midheaven, latitude, obliquity);
-      break;
-
-    case 'regiomontanus':
-      cusps = regiomontanusHouses(angles.ascendant, angles.midheaven, latitude, obliquity);
-      break;
-
-    case 'campanus':
-      cusps = campanusHouses(angles.ascendant, angles.midheaven, latitude, obliquity);
-      break;
-
-    default:
-      // TypeScript should prevent this, but be defensive
-      throw new Error(`Unknown house system: ${system}`);
-  }
+  const cusps = calculateCusps(system, angles, lst, location.latitude, obliquity);
 
   return {
     system,
@@ -143,14 +164,7 @@ export function calculateAnglesOnly(
   lst: number,
   julianCenturies: number,
 ): Angles {
-  // Validate location
-  const validation = validateLocation(location);
-  if (!validation.valid) {
-    throw new Error(`Invalid location: ${validation.errors.join(', ')}`);
-  }
-
-  const obliquity = meanObliquity(julianCenturies);
-  return calculateAngles(lst, obliquity, location.latitude);
+  return prepareHouseFrame(location, lst, julianCenturies).angles;
 }
 
 /**
@@ -192,10 +206,22 @@ export function calculateMultipleSystems(
     'campanus',
   ],
 ): Record<HouseSystem, HouseData> {
+  // Obliquity and angles are independent of the house system
+  const { obliquity, angles } = prepareHouseFrame(location, lst, julianCenturies);
+
   const results: Partial<Record<HouseSystem, HouseData>> = {};
 
   for (const system of systems) {
-    results[system] = calculateHouses(location, lst, julianCenturies, system);
+    results[system] = {
+      system,
+      // Each result gets its own copy so callers can't mutate another system's angles
+      angles: { ...angles },
+      cusps: calculateCusps(system, angles, lst, location.latitude, obliquity),
+      latitude: location.latitude,
+      longitude: location.longitude,
+      lst,
+      obliquity,
+    };
   }
 
   return results as Record<HouseSystem, HouseData>;
@@ -174,6 +174,7 @@ export {
   type AspectConfig,
   type AspectDetectionResult,
   calculateProgressedAspects,
+  detectAspectsFromPositions,
   detectProgressedAspects,
   detectProgressedToNatalAspects,
   detectProgressedToProgressedAspects,
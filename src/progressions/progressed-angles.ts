@@ -95,25 +95,24 @@ function createProgressedAngle(
   natalLongitude: number,
   progressedLongitude: number,
 ): ProgressedPosition {
-  const natalZodiac = longitudeToZodiac(natalLongitude);
+  const natalSignIndex = Math.floor(normalizeLongitude(natalLongitude) / 30);
   const progressedZodiac = longitudeToZodiac(progressedLongitude);
 
-  let arcFromNatal = progressedLongitude - natalLongitude;
-  // Normalize to -180 to 180
-  while (arcFromNatal > 180) arcFromNatal -= 360;
-  while (arcFromNatal < -180) arcFromNatal += 360;
+  // Shortest arc between natal and progressed (0-180)
+  const forwardArc = normalizeLongitude(progressedLongitude - natalLongitude);
+  const arcFromNatal = forwardArc > 180 ? 360 - forwardArc : forwardArc;
 
   return {
     longitude: progressedLongitude,
     natalLongitude,
-    arcFromNatal: Math.abs(arcFromNatal),
+    arcFromNatal,
     signIndex: progressedZodiac.signIndex,
     signName: progressedZodiac.signName,
     degree: progressedZodiac.degree,
     minute: progressedZodiac.minute,
     second: progressedZodiac.second,
     formatted: progressedZodiac.formatted,
-    hasChangedSign: progressedZodiac.signIndex !== natalZodiac.signIndex,
+    hasChangedSign: progressedZodiac.signIndex !== natalSignIndex,
   };
 }
 
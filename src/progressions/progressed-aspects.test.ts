@@ -10,6 +10,7 @@ import { describe, it } from 'node:test';
 import { AspectType } from '../aspects/types.js';
 import {
   calculateProgressedAspects,
+  detectAspectsFromPositions,
   detectProgressedAspects,
   detectProgressedToNatalAspects,
   detectProgressedToProgressedAspects,
@@ -21,7 +22,11 @@ import {
   getStrongestAspect,
   sortByStrength,
 } from './progressed-aspects.js';
-import { getNatalPosition, getProgressedPosition } from './progressed-positions.js';
+import {
+  getAllProgressedPositions,
+  getNatalPosition,
+  getProgressedPosition,
+} from './progressed-positions.js';
 import { birthToJD } from './progression-date.js';
 
 // =============================================================================
@@ -179,6 +184,33 @@ describe('progressions/progressed-aspects', () => {
     });
   });
 
+  describe('detectAspectsFromPositions', () => {
+    it('should carry the same natal longitudes as getNatalPosition', () => {
+      const birthJD = birthToJD(J2000_BIRTH);
+      const targetJD = birthJD + 30 * 365.25;
+      const positions = getAllProgressedPositions(birthJD, targetJD);
+
+      for (const p of positions) {
+        assert.equal(p.natalLongitude, getNatalPosition(p.name, birthJD).longitude);
+      }
+    });
+
+    it('should match detection against separately computed natal positions', () => {
+      const birthJD = birthToJD(J2000_BIRTH);
+      const targetJD = birthJD + 30 * 365.25;
+      const positions = getAllProgressedPositions(birthJD, targetJD);
+      const natalPositions = positions.map((p) => ({
+        name: p.name,
+        longitude: getNatalPosition(p.name, birthJD).longitude,
+      }));
+
+      const expected = positions.flatMap((p) => detectProgressedToNatalAspects(p, natalPositions));
+      const result = detectAspectsFromPositions(positions);
+
+      assert.deepEqual(result.aspects, expected);
+    });
+  });
+
   describe('calculateProgressedAspects', () => {
     it('should work with date objects', () => {
       const target = { year: 2030, month: 1, day: 1 };
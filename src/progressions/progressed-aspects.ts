@@ -17,17 +17,8 @@
  */
 
 import type { AspectType } from '../aspects/types.js';
-import {
-  DEFAULT_PROGRESSION_BODIES,
-  EXACT_THRESHOLD,
-  MAJOR_PROGRESSION_ASPECTS,
-  PROGRESSION_ORBS,
-} from './constants.js';
-import {
-  getNatalPosition,
-  getProgressedPosition,
-  type ProgressedBodyName,
-} from './progressed-positions.js';
+import { EXACT_THRESHOLD, MAJOR_PROGRESSION_ASPECTS, PROGRESSION_ORBS } from './constants.js';
+import { getAllProgressedPositions } from './progressed-positions.js';
 import { birthToJD, targetToJD } from './progression-date.js';
 import type {
   ProgressedAspect,
@@ -356,19 +347,29 @@ export function detectProgressedAspects(
   progressionType: ProgressionType = 'secondary',
   config: AspectConfig = {},
 ): AspectDetectionResult {
-  const bodies = DEFAULT_PROGRESSION_BODIES as unknown as ProgressedBodyName[];
+  const progressedPositions = getAllProgressedPositions(birthJD, targetJD, progressionType);
+  return detectAspectsFromPositions(progressedPositions, config);
+}
 
-  // Get natal positions
-  const natalPositions = bodies.map((name) => ({
-    name,
-    longitude: getNatalPosition(name, birthJD).longitude,
+/**
+ * Detect all aspects from already calculated progressed positions.
+ *
+ * Natal positions are taken from each body's `natalLongitude`, so callers
+ * that already hold the progressed planets avoid a second ephemeris pass.
+ *
+ * @param progressedPositions - Progressed planets (natal longitudes included)
+ * @param config - Aspect detection configuration
+ * @returns Complete aspect detection result
+ */
+export function detectAspectsFromPositions(
+  progressedPositions: ProgressedPlanet[],
+  config: AspectConfig = {},
+): AspectDetectionResult {
+  const natalPositions = progressedPositions.map((p) => ({
+    name: p.name,
+    longitude: p.natalLongitude,
   }));
 
-  // Get progressed positions
-  const progressedPositions = bodies.map((name) =>
-    getProgressedPosition(name, birthJD, targetJD, progressionType),
-  );
-
   // Detect progressed-to-natal aspects
   const pToNAspects: ProgressedAspect[] = [];
   for (const progressed of progressedPositions) {
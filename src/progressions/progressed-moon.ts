@@ -202,7 +202,7 @@ export function getProgressedMoon(
 ): ProgressedPlanet {
   // Get natal Moon
   const natal = getMoonPosition(birthJD);
-  const natalZodiac = longitudeToZodiac(natal.longitude);
+  const natalSignIndex = Math.floor(normalizeLongitude(natal.longitude) / 30);
 
   // Get progressed position
   const progressedJD = getProgressedJD(birthJD, targetJD, progressionType);
@@ -215,8 +215,7 @@ export function getProgressedMoon(
   const estimatedTotalArc = yearsElapsed * MOON_MEAN_DAILY_MOTION;
 
   // Calculate direct arc (may be < 360)
-  let directArc = progressed.longitude - natal.longitude;
-  while (directArc < 0) directArc += 360;
+  const directArc = normalizeLongitude(progressed.longitude - natal.longitude);
 
   // Determine how many full cycles (with small epsilon for floating point)
   const fullCycles = Math.floor((estimatedTotalArc + 0.001) / 360);
@@ -236,7 +235,7 @@ export function getProgressedMoon(
     minute: progressedZodiac.minute,
     second: progressedZodiac.second,
     formatted: progressedZodiac.formatted,
-    hasChangedSign: progressedZodiac.signIndex !== natalZodiac.signIndex,
+    hasChangedSign: progressedZodiac.signIndex !== natalSignIndex,
 
     // ProgressedPlanet-specific fields
     name: 'Moon',
@@ -234,7 +234,8 @@ export function getProgressedPosition(
   // Get natal position and retrograde status
   const natal = getPosition(birthJD);
   const natalRetrograde = isRetrograde(birthJD, getPosition);
-  const natalZodiac = longitudeToZodiac(natal.longitude);
+  // Only the natal sign is needed; skip the DMS breakdown and formatting
+  const natalSignIndex = Math.floor(normalizeLongitude(natal.longitude) / 30);
 
   let progressedLong: number;
   let progressedRetrograde: boolean;
@@ -254,29 +255,30 @@ export function getProgressedPosition(
     progressedJD = getProgressedJD(birthJD, targetJD, progressionType);
     const progressed = getPosition(progressedJD);
     progressedLong = progressed.longitude;
-    progressedRetrograde = isRetrograde(progressedJD, getPosition);
+    // Speed and retrograde status come from the same ±0.5 day samples,
+    // so evaluate the ephemeris once and derive both
     progressedSpeed = calculateLongitudeSpeed(progressedJD, getPosition);
+    progressedRetrograde = progressedSpeed < 0;
   }
 
   const progressedZodiac = longitudeToZodiac(progressedLong);
 
-  // Calculate arc from natal (normalized to -180 to 180)
-  let arcFromNatal = progressedLong - natal.longitude;
-  while (arcFromNatal > 180) arcFromNatal -= 360;
-  while (arcFromNatal < -180) arcFromNatal += 360;
+  // Calculate arc from natal (shortest arc, 0-180)
+  const forwardArc = normalizeLongitude(progressedLong - natal.longitude);
+  const arcFromNatal = forwardArc > 180 ? 360 - forwardArc : forwardArc;
 
   return {
     // ProgressedPosition fields
     longitude: progressedLong,
     natalLongitude: natal.longitude,
-    arcFromNatal: Math.abs(arcFromNatal),
+    arcFromNatal,
     signIndex: progressedZodiac.signIndex,
     signName: progressedZodiac.signName,
     degree: progressedZodiac.degree,
     minute: progressedZodiac.minute,
     second: progressedZodiac.second,
     formatted: progressedZodiac.formatted,
-    hasChangedSign: progressedZodiac.signIndex !== natalZodiac.signIndex,
+    hasChangedSign: progressedZodiac.signIndex !== natalSignIndex,
 
     // ProgressedPlanet-specific fields
     name: bodyName,
@@ -6,10 +6,11 @@
  * @module progressions/progression-summary
  */
 
-import { DEFAULT_PROGRESSION_CONFIG } from './constants.js';
+import { DEFAULT_PROGRESSION_CONFIG, SIGN_NAMES } from './constants.js';
 import { calculateProgressedAngles } from './progressed-angles.js';
 import {
   type AspectDetectionResult,
+  detectAspectsFromPositions,
   detectProgressedAspects,
   getStrongestAspect,
 } from './progressed-aspects.js';
@@ -110,21 +111,6 @@ function createSolarArcPositions(
  * Create sign change records from planets.
  */
 function createSignChanges(planets: ProgressedPlanet[]): ProgressedSignChange[] {
-  const SIGN_NAMES = [
-    'Aries',
-    'Taurus',
-    'Gemini',
-    'Cancer',
-    'Leo',
-    'Virgo',
-    'Libra',
-    'Scorpio',
-    'Sagittarius',
-    'Capricorn',
-    'Aquarius',
-    'Pisces',
-  ];
-
   return planets
     .filter((p) => p.hasChangedSign)
     .map((p) => {
@@ -256,8 +242,8 @@ export function calculateProgression(
     imumCoeli: anglesResult.imumCoeli,
   };
 
-  // Detect aspects
-  const aspectResult = detectProgressedAspects(birthJD, targetJD, mergedConfig.type, {
+  // Detect aspects (reusing the positions above rather than recomputing them)
+  const aspectResult = detectAspectsFromPositions(planets, {
     aspectTypes: mergedConfig.aspectTypes,
     orbs: mergedConfig.orbs,
     includeProgressedToProgressed: mergedConfig.includeProgressedAspects,
@@ -20,6 +20,19 @@ import { SIGN_NAMES, SUN_MEAN_DAILY_MOTION } from './constants.js';
 import { birthToJD, getProgressedJD, targetToJD } from './progression-date.js';
 import type { ProgressedPosition, ProgressionBirthData, ProgressionTargetDate } from './types.js';
 
+// =============================================================================
+// HELPER FUNCTIONS
+// =============================================================================
+
+/**
+ * Normalize longitude to 0-360 range.
+ */
+function normalizeLongitude(longitude: number): number {
+  let result = longitude % 360;
+  if (result < 0) result += 360;
+  return result;
+}
+
 // =============================================================================
 // CORE SOLAR ARC CALCULATIONS
 // =============================================================================
@@ -55,15 +68,12 @@ export function calculateSolarArc(birthJD: number, targetJD: number): number {
   const progressedSun = getSunPosition(progressedJD);
 
   // Calculate arc (handling wraparound at 0°/360°)
-  let arc = progressedSun.longitude - natalSun.longitude;
+  const arc = progressedSun.longitude - natalSun.longitude;
 
   // Normalize to reasonable range
   // Solar arc should typically be positive (Sun always progresses forward in secondary)
   // but can be large for old charts
-  while (arc < 0) arc += 360;
-  while (arc >= 360) arc -= 360;
-
-  return arc;
+  return normalizeLongitude(arc);
 }
 
 /**
@@ -137,13 +147,8 @@ export function getProgressedSunLongitude(birthJD: number, targetJD: number): nu
  * ```
  */
 export function applySolarArc(natalLongitude: number, solarArc: number): number {
-  let directed = natalLongitude + solarArc;
-
   // Normalize to 0-360°
-  while (directed < 0) directed += 360;
-  while (directed >= 360) directed -= 360;
-
-  return directed;
+  return normalizeLongitude(natalLongitude + solarArc);
 }
 
 /**
@@ -172,9 +177,7 @@ export function longitudeToZodiacPosition(longitude: number): {
   formatted: string;
 } {
   // Normalize
-  let long = longitude;
-  while (long < 0) long += 360;
-  while (long >= 360) long -= 360;
+  const long = normalizeLongitude(longitude);
 
   const signIndex = Math.floor(long / 30);
   const positionInSign = long - signIndex * 30;
@@ -202,7 +205,7 @@ export function createDirectedPosition(
 ): ProgressedPosition {
   const directedLongitude = applySolarArc(natalLongitude, solarArc);
   const zodiac = longitudeToZodiacPosition(directedLongitude);
-  const natalZodiac = longitudeToZodiacPosition(natalLongitude);
+  const natalSignIndex = Math.floor(normalizeLongitude(natalLongitude) / 30);
 
   return {
     longitude: directedLongitude,
@@ -214,7 +217,7 @@ export function createDirectedPosition(
     minute: zodiac.minute,
     second: zodiac.second,
     formatted: zodiac.formatted,
-    hasChangedSign: zodiac.signIndex !== natalZodiac.signIndex,
+    hasChangedSign: zodiac.signIndex !== natalSignIndex,
   };
 }
 
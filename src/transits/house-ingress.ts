@@ -22,7 +22,7 @@
 import { type CelestialBody, getPosition } from '../ephemeris/positions.js';
 import { getHousePosition } from '../houses/house-utils.js';
 import { AVERAGE_DAILY_MOTION, BODY_NAMES, MAX_BINARY_SEARCH_ITERATIONS } from './constants.js';
-import { jdToTransitDate, normalizeAngle } from './transit-detection.js';
+import { formatTransitDate, jdToTransitDate, normalizeAngle } from './transit-detection.js';
 import type { HouseIngress } from './types.js';
 
 // =============================================================================
@@ -524,10 +524,7 @@ export function getBodyHouses(
  * @returns Human-readable string
  */
 export function formatHouseIngress(ingress: HouseIngress): string {
-  const date = ingress.ingressDate;
-  const dateStr = date
-    ? `${date.year}-${String(date.month).padStart(2, '0')}-${String(date.day).padStart(2, '0')}`
-    : 'unknown date';
+  const dateStr = ingress.ingressDate ? formatTransitDate(ingress.ingressDate) : 'unknown date';
 
   const retro = ingress.isRetrograde ? ' ℞' : '';
   const direction = ingress.direction === 'entering' ? '→' : '←';
@@ -30,7 +30,7 @@ import {
   RETROGRADE_PLANETS,
   STATIONARY_SPEED_THRESHOLD,
 } from './constants.js';
-import { jdToTransitDate } from './transit-detection.js';
+import { formatTransitDate, jdToTransitDate } from './transit-detection.js';
 import type { RetrogradePeriod, StationPoint, TransitDate } from './types.js';
 
 // =============================================================================
@@ -607,11 +607,8 @@ export function getRetrogradeShadow(period: RetrogradePeriod): {
  * @returns Human-readable string
  */
 export function formatRetrogradePeriod(period: RetrogradePeriod): string {
-  const startDate = jdToTransitDate(period.stationRetroJD);
-  const endDate = jdToTransitDate(period.stationDirectJD);
-
-  const startStr = `${startDate.year}-${String(startDate.month).padStart(2, '0')}-${String(startDate.day).padStart(2, '0')}`;
-  const endStr = `${endDate.year}-${String(endDate.month).padStart(2, '0')}-${String(endDate.day).padStart(2, '0')}`;
+  const startStr = formatTransitDate(jdToTransitDate(period.stationRetroJD));
+  const endStr = formatTransitDate(jdToTransitDate(period.stationDirectJD));
 
   return (
     `${BODY_NAMES[period.body]} Rx: ${startStr} to ${endStr} (${period.durationDays.toFixed(0)} days)\n` +
@@ -627,8 +624,7 @@ export function formatRetrogradePeriod(period: RetrogradePeriod): string {
  * @returns Human-readable string
  */
 export function formatStationPoint(station: StationPoint): string {
-  const date = station.date;
-  const dateStr = `${date.year}-${String(date.month).padStart(2, '0')}-${String(date.day).padStart(2, '0')}`;
+  const dateStr = formatTransitDate(station.date);
   const typeStr = station.type === 'station-retrograde' ? 'Stations Retrograde' : 'Stations Direct';
 
   return `${BODY_NAMES[station.body]} ${typeStr} at ${station.longitude.toFixed(2)}° on ${dateStr}`;
@@ -630,6 +630,18 @@ export function jdToTransitDate(jd: number): TransitDate {
   return { year, month, day, hour, minute, second };
 }
 
+/**
+ * Format a TransitDate as YYYY-MM-DD.
+ *
+ * @param date - Calendar date
+ * @returns ISO-style date string
+ *
+ * @internal
+ */
+export function formatTransitDate(date: TransitDate): string {
+  return `${date.year}-${String(date.month).padStart(2, '0')}-${String(date.day).padStart(2, '0')}`;
+}
+
 // =============================================================================
 // MAIN API
 // =============================================================================
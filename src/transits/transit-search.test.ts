@@ -86,6 +86,33 @@ describe('searchTransits', () => {
     );
   });
 
+  it('should give each pass its own timing arrays and dates', () => {
+    const result = searchTransits({
+      startJD: J2000_JD,
+      endJD: J2000_JD + 365,
+      natalPoints: MINIMAL_NATAL,
+    });
+
+    // Passes of the same body, natal point and aspect share their timing values
+    const [a, b] = result.transits.filter(
+      (t) =>
+        t.transit.transitingBodyEnum === result.transits[0].transit.transitingBodyEnum &&
+        t.transit.natalPoint === result.transits[0].transit.natalPoint &&
+        t.transit.aspectType === result.transits[0].transit.aspectType,
+    );
+    assert.ok(b, 'Expected at least two passes of the same transit');
+
+    const exactCount = b.exactDates.length;
+    const enterDay = b.enterOrbDate.day;
+    a.exactJDs.push(0);
+    a.exactDates.push({ ...a.exactDates[0] });
+    a.enterOrbDate.day = -1;
+
+    assert.equal(b.exactJDs.length, exactCount);
+    assert.equal(b.exactDates.length, exactCount);
+    assert.equal(b.enterOrbDate.day, enterDay);
+  });
+
   it('should return results sorted by date', () => {
     const result = searchTransits({
       startJD: J2000_JD,
@@ -25,13 +25,22 @@ import {
   DEFAULT_TRANSITING_BODIES,
   FAST_PLANETS,
 } from './constants.js';
-import { angularSeparation, getEffectiveOrb, jdToTransitDate } from './transit-detection.js';
-import { findAllExactTimes, findTransitTiming, getSearchStepForBody } from './transit-timing.js';
+import {
+  angularSeparation,
+  formatTransitDate,
+  getEffectiveOrb,
+  jdToTransitDate,
+} from './transit-detection.js';
+import {
+  findExactTimesInSamples,
+  findTransitTiming,
+  getSearchStepForBody,
+  sampleLongitudes,
+} from './transit-timing.js';
 import type {
   NatalPoint,
   Transit,
   TransitConfig,
-  TransitDate,
   TransitSearchParams,
   TransitSearchResult,
   TransitTiming,
@@ -93,6 +102,9 @@ export function searchTransits(params: TransitSearchParams): TransitSearchResult
   for (const body of bodies) {
     const step = stepDays ?? getSearchStepForBody(body);
 
+    // Sample the body once and share the scan across all natal points and aspects
+    const samples = sampleLongitudes(body, startJD, endJD, step);
+
     for (const natalPoint of natalPoints) {
       // Search for each aspect type
       for (const aspectType of aspectTypes) {
@@ -100,15 +112,17 @@ export function searchTransits(params: TransitSearchParams): TransitSearchResult
         const aspectAngle = getAspectAngle(aspectType);
 
         // Find all exact times for this aspect
-        const exactTimes = findAllExactTimes(
+        const exactTimes = findExactTimesInSamples(
           body,
+          samples,
           natalPoint.longitude,
           aspectAngle,
-          startJD,
-          endJD,
-          step,
         );
 
+        // Timing depends only on body, natal point and aspect, not on the
+        // individual pass, so compute it at most once per combination
+        let timing: ReturnType<typeof findTransitTiming> | undefined;
+
         // Create transit timing for each exact time
         for (const exactJD of exactTimes) {
           const key = `${body}-${natalPoint.name}-${aspectType}`;
@@ -127,14 +141,16 @@ export function searchTransits(params: TransitSearchParams): TransitSearchResult
           }
 
           // Get timing information
-          const timing = findTransitTiming(
-            body,
-            natalPoint.longitude,
-            aspectAngle,
-            orb,
-            startJD,
-            endJD,
-          );
+          if (timing === undefined) {
+            timing = findTransitTiming(
+              body,
+              natalPoint.longitude,
+              aspectAngle,
+              orb,
+              startJD,
+              endJD,
+            );
+          }
 
           if (timing) {
             // Build the Transit object
@@ -160,8 +176,13 @@ export function searchTransits(params: TransitSearchParams): TransitSearchResult
               exactDate: jdToTransitDate(exactJD),
             };
 
+            // Copy the memoized arrays and dates so passes don't share them
             const transitTiming: TransitTiming = {
               ...timing,
+              enterOrbDate: { ...timing.enterOrbDate },
+              exactJDs: [...timing.exactJDs],
+              exactDates: timing.exactDates.map((d) => ({ ...d })),
+              leaveOrbDate: { ...timing.leaveOrbDate },
               transit,
             };
 
@@ -505,27 +526,18 @@ export function formatTransitTimingDetail(timing: TransitTiming): string {
   const lines = [
     `${transit.transitingBody} ${transit.symbol} ${transit.natalPoint}${retro}${passes}`,
     `  Duration: ${timing.durationDays.toFixed(1)} days`,
-    `  Enters orb: ${formatDate(timing.enterOrbDate)}`,
+    `  Enters orb: ${formatTransitDate(timing.enterOrbDate)}`,
   ];
 
   for (let i = 0; i < timing.exactDates.length; i++) {
-    lines.push(`  Exact #${i + 1}: ${formatDate(timing.exactDates[i])}`);
+    lines.push(`  Exact #${i + 1}: ${formatTransitDate(timing.exactDates[i])}`);
   }
 
-  lines.push(`  Leaves orb: ${formatDate(timing.leaveOrbDate)}`);
+  lines.push(`  Leaves orb: ${formatTransitDate(timing.leaveOrbDate)}`);
 
   return lines.join('\n');
 }
 
-/**
- * Format a TransitDate for display.
- *
- * @internal
- */
-function formatDate(date: TransitDate): string {
-  return `${date.year}-${String(date.month).padStart(2, '0')}-${String(date.day).padStart(2, '0')}`;
-}
-
 /**
  * Get aspect angle from type.
  *
@@ -26,6 +26,7 @@ import {
 } from './constants.js';
 import {
   angularSeparation,
+  formatTransitDate,
   jdToTransitDate,
   normalizeAngle,
   signedAngularDifference,
@@ -240,28 +241,119 @@ export function findAllExactTimes(
   endJD: number,
   scanStep?: number,
 ): number[] {
-  const exactTimes: number[] = [];
-
   // Determine scan step based on body speed
   const avgMotion = Math.abs(AVERAGE_DAILY_MOTION[body] ?? 0.1);
   const step = scanStep ?? Math.max(1, Math.min(7, 0.5 / avgMotion));
 
-  let windowStart = startJD;
+  const samples = sampleLongitudes(body, startJD, endJD, step);
+  return findExactTimesInSamples(body, samples, natalLongitude, aspectAngle);
+}
+
+// =============================================================================
+// SAMPLED SCANNING
+// =============================================================================
+
+/**
+ * Longitudes of a transiting body sampled on a fixed scan grid.
+ *
+ * @internal
+ */
+export interface LongitudeSamples {
+  /** Julian Dates of the scan window boundaries */
+  jds: Float64Array;
+
+  /** Ecliptic longitude of the body at each boundary */
+  longitudes: Float64Array;
+}
+
+/**
+ * Sample a body's longitude at every scan window boundary.
+ *
+ * @param body - Transiting body
+ * @param startJD - Start of search window
+ * @param endJD - End of search window
+ * @param step - Days between samples
+ * @returns Sampled Julian Dates and longitudes
+ *
+ * @remarks
+ * The grid is identical to the windows walked by {@link findAllExactTimes},
+ * so one set of samples can be shared by every natal point and aspect
+ * searched for the same body. Adjacent windows share their boundary, so
+ * each position is evaluated only once.
+ *
+ * @internal
+ */
+export function sampleLongitudes(
+  body: CelestialBody,
+  startJD: number,
+  endJD: number,
+  step: number,
+): LongitudeSamples {
+  const boundaries: number[] = [startJD];
 
+  let windowStart = startJD;
   while (windowStart < endJD) {
-    const windowEnd = Math.min(windowStart + step, endJD);
+    windowStart = Math.min(windowStart + step, endJD);
+    boundaries.push(windowStart);
+  }
+
+  const jds = Float64Array.from(boundaries);
+  const longitudes = new Float64Array(jds.length);
+
+  for (let i = 0; i < jds.length; i++) {
+    // Only the longitude is needed for crossing detection
+    longitudes[i] = getPosition(body, jds[i], { includeSpeed: false }).longitude;
+  }
+
+  return { jds, longitudes };
+}
+
+/**
+ * Find all exact times in pre-sampled longitudes.
+ *
+ * @param body - Transiting body
+ * @param samples - Longitudes sampled with {@link sampleLongitudes}
+ * @param natalLongitude - Natal point longitude
+ * @param aspectAngle - Target aspect angle
+ * @returns Array of Julian Dates for each exact aspect
+ *
+ * @remarks
+ * Only windows whose sampled deviations show a crossing (or an endpoint
+ * already within tolerance) are refined with {@link findExactTransitTime}.
+ *
+ * @internal
+ */
+export function findExactTimesInSamples(
+  body: CelestialBody,
+  samples: LongitudeSamples,
+  natalLongitude: number,
+  aspectAngle: number,
+): number[] {
+  const { jds, longitudes } = samples;
+  const exactTimes: number[] = [];
+
+  let devStart = calculateSignedDeviation(longitudes[0], natalLongitude, aspectAngle);
 
-    // Check for crossing in this sub-window
-    const exactJD = findExactTransitTime(body, natalLongitude, aspectAngle, windowStart, windowEnd);
+  for (let i = 1; i < jds.length; i++) {
+    const devEnd = calculateSignedDeviation(longitudes[i], natalLongitude, aspectAngle);
 
-    if (exactJD !== null) {
-      // Avoid duplicates (within 1 day)
-      if (exactTimes.length === 0 || exactJD - exactTimes[exactTimes.length - 1] > 1) {
-        exactTimes.push(exactJD);
+    const mayCross =
+      devStart * devEnd <= 0 ||
+      Math.abs(devStart) < EXACT_TIME_TOLERANCE ||
+      Math.abs(devEnd) < EXACT_TIME_TOLERANCE;
+
+    if (mayCross) {
+      const exactJD = findExactTransitTime(body, natalLongitude, aspectAngle, jds[i - 1], jds[i]);
+
+      if (exactJD !== null) {
+        // Avoid duplicates (within 1 day)
+        if (exactTimes.length === 0 || exactJD - exactTimes[exactTimes.length - 1] > 1) {
+          exactTimes.push(exactJD);
+        }
       }
     }
 
-    windowStart = windowEnd;
+    devStart = devEnd;
   }
 
   return exactTimes;
@@ -692,23 +784,17 @@ export function getSearchStepForBody(body: CelestialBody): number {
 export function formatTransitTiming(
   timing: TransitTiming | Omit<TransitTiming, 'transit'>,
 ): string {
-  const enter = timing.enterOrbDate;
-  const exit = timing.leaveOrbDate;
-
   const lines: string[] = [
-    `Enters orb: ${enter.year}-${String(enter.month).padStart(2, '0')}-${String(enter.day).padStart(2, '0')}`,
+    `Enters orb: ${formatTransitDate(timing.enterOrbDate)}`,
     `Exact passes: ${timing.exactPasses}`,
   ];
 
   for (let i = 0; i < timing.exactDates.length; i++) {
-    const d = timing.exactDates[i];
-    lines.push(
-      `  Pass ${i + 1}: ${d.year}-${String(d.month).padStart(2, '0')}-${String(d.day).padStart(2, '0')}`,
-    );
+    lines.push(`  Pass ${i + 1}: ${formatTransitDate(timing.exactDates[i])}`);
   }
 
   lines.push(
-    `Leaves orb: ${exit.year}-${String(exit.month).padStart(2, '0')}-${String(exit.day).padStart(2, '0')}`,
+    `Leaves orb: ${formatTransitDate(timing.leaveOrbDate)}`,
     `Duration: ${timing.durationDays.toFixed(1)} days`,
   );
 
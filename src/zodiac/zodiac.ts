@@ -113,7 +113,9 @@ export function eclipticToZodiac(longitude: number): ZodiacPosition {
   const sign: Sign = signIndex === 12 ? Sign.Aries : (signIndex as Sign);
 
   // Calculate degree within sign (0.0 - 29.999...)
-  const degreeInSign = normalized % 30;
+  // Reuses the sign quotient instead of a second modulo; the subtraction
+  // is exact, so this matches `normalized % 30` bit for bit
+  const degreeInSign = normalized - signIndex * 30;
 
   // Extract integer degrees
   const degree = Math.floor(degreeInSign);